@@ -1,45 +1,268 @@
-"""Odoo client based on the odooly library."""
-
+"""Odoo client based on the odooly library, with an optional JSON-RPC transport."""
+
+import asyncio
+import hashlib
+import http.client
+import importlib.util
+import itertools
+import json
 import os
-import xmlrpc
 import ssl
-from typing import Any, cast
-
-from pydantic import BaseModel, Field
+import threading
+import time
+import xmlrpc.client
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, ClassVar, Literal, cast
+
+import httpx
+from pydantic import BaseModel, Field, TypeAdapter
 
 try:
     from odooly import Client as OdoolyClient  # type: ignore
 except Exception:  # pragma: no cover - odooly might not be installed in tests
     OdoolyClient = None  # type: ignore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+
+# HTTP/2 needs the optional h2 package (pip install "odoo-mcp-server[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Shared by every XML-RPC transport so TLS sessions can be resumed across the pool
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX_INSECURE = ssl._create_unverified_context()
+
+# Odoo reports AccessDenied as fault code 3; releases before 11 use the name
+AUTH_FAULT_CODES = (3, "AccessDenied", "Access Denied")
+
+
+def _dumps(payload: Any) -> bytes:
+    """Encode a JSON-RPC payload, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload).encode()
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a JSON-RPC response, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _custom_header() -> tuple[str, str] | None:
+    """Return the extra header configured through environment variables."""
+    header_name = os.getenv("ODOO_CUSTOM_HEADER_NAME")
+    header_value = os.getenv("ODOO_CUSTOM_HEADER_VALUE")
+    return (header_name, header_value) if header_name and header_value else None
+
 
 class CustomClient(OdoolyClient):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.transport = CustomTransport()
 
 
 class CustomTransport(xmlrpc.client.SafeTransport):
-    def __init__(self, context=None):
-        super().__init__(context)
-        self.context = ssl._create_unverified_context()
-
-    def send_headers(self, connection, headers):
-        # Get custom header from environment variables
-        header_name = os.getenv("ODOO_CUSTOM_HEADER_NAME")
-        header_value = os.getenv("ODOO_CUSTOM_HEADER_VALUE")
-        
-        if header_name and header_value:
-            connection.putheader(header_name, header_value)
-            super().send_headers(connection, headers)
-        else:
-            super().send_headers(connection, headers)
+    # Ask for gzip responses; Transport.parse_response decompresses them
+    accept_gzip_encoding = True
+
+    def __init__(
+        self,
+        context: ssl.SSLContext | None = None,
+        timeout: float | None = None,
+        verify_tls: bool = True,
+    ) -> None:
+        super().__init__(context=context)
+        self.context = context or (_SSL_CTX if verify_tls else _SSL_CTX_INSECURE)
+        self.timeout = timeout
+        self._extra_header = _custom_header()
+
+    def make_connection(
+        self, host: str | tuple[str, dict[str, str]]
+    ) -> http.client.HTTPSConnection:
+        # Reuse the cached connection so consecutive RPCs share one TLS session
+        if self._connection and host == self._connection[0]:
+            return cast(http.client.HTTPSConnection, self._connection[1])
+
+        # x509 key/cert files are not supported; TLS is configured through the context
+        chost, self._extra_headers, _ = self.get_host_info(host)
+        connection = http.client.HTTPSConnection(chost, context=self.context, timeout=self.timeout)
+        self._connection = host, connection
+        return connection
+
+    def send_headers(
+        self, connection: http.client.HTTPConnection, headers: list[tuple[str, str]]
+    ) -> None:
+        connection.putheader("Connection", "keep-alive")
+        if self._extra_header:
+            connection.putheader(*self._extra_header)
+        super().send_headers(connection, headers)
+
+
+class JsonRpcError(Exception):
+    """Error returned by the Odoo JSON-RPC endpoint."""
+
+    def __init__(self, error: dict[str, Any]) -> None:
+        data = error.get("data") or {}
+        self.code = error.get("code")
+        self.name: str = data.get("name", "")
+        super().__init__(data.get("message") or error.get("message", "Odoo JSON-RPC error"))
+
+
+def _is_auth_error(error: Exception) -> bool:
+    """Return True if an RPC error means the credentials were rejected."""
+    if isinstance(error, xmlrpc.client.Fault):
+        return error.faultCode in AUTH_FAULT_CODES
+    if isinstance(error, JsonRpcError):
+        return error.name.endswith("AccessDenied")
+    return False
+
+
+def _new_http_client(
+    timeout: float | None,
+    max_connections: int | None = None,
+    verify_tls: bool = True,
+) -> httpx.Client:
+    """Create the keep-alive HTTP client used by the JSON-RPC transport.
+
+    HTTP/2 is negotiated when ``h2`` is installed, so concurrent requests are
+    multiplexed over one TLS connection; servers that only speak HTTP/1.1
+    get up to ``max_connections`` keep-alive connections instead.
+    """
+    headers = {"Connection": "keep-alive"}
+    extra_header = _custom_header()
+    if extra_header:
+        headers[extra_header[0]] = extra_header[1]
+
+    limits = httpx.Limits(
+        max_connections=max_connections, max_keepalive_connections=max_connections
+    )
+    return httpx.Client(
+        headers=headers,
+        timeout=timeout,
+        verify=verify_tls,
+        http2=HTTP2_AVAILABLE,
+        limits=limits,
+    )
+
+
+class JsonRpcModel:
+    """Proxy turning attribute calls into ``execute_kw`` calls on one model."""
+
+    def __init__(self, client: "JsonRpcClient", model: str) -> None:
+        self._client = client
+        self._model = model
+
+    def __getattr__(self, method: str) -> Any:
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._client.execute_kw(self._model, method, list(args), kwargs)
+
+        return call
+
+
+class JsonRpcEnv:
+    """Mapping of model names to ``JsonRpcModel`` proxies, like ``odooly.Env``."""
+
+    def __init__(self, client: "JsonRpcClient") -> None:
+        self._client = client
+
+    def __getitem__(self, model: str) -> JsonRpcModel:
+        return JsonRpcModel(self._client, model)
+
+
+class JsonRpcClient:
+    """Odoo client speaking JSON-RPC on ``/jsonrpc``.
+
+    Exposes the subset of the odooly client surface used by ``OdooClient``
+    (``authenticate`` and ``env[model].method(...)``). Responses are decoded
+    by orjson when installed, or the C ``json`` module otherwise, instead of
+    the pure-Python XML-RPC unmarshaller.
+    """
+
+    def __init__(
+        self,
+        server: str,
+        db: str,
+        user: str,
+        password: str | None,
+        http_client: httpx.Client | None = None,
+        timeout: float | None = None,
+        verify_tls: bool = True,
+    ) -> None:
+        self._endpoint = server.rstrip("/") + "/jsonrpc"
+        self._db = db
+        self._user = user
+        self._password = password
+        self._ids = itertools.count(1)
+        self.uid: int | None = None
+        self.env = JsonRpcEnv(self)
+        self._http = http_client or _new_http_client(timeout, verify_tls=verify_tls)
+
+    def _call(self, service: str, method: str, *args: Any) -> Any:
+        """Send one JSON-RPC request and return its result."""
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service, "method": method, "args": args},
+            "id": next(self._ids),
+        }
+        response = self._http.post(
+            self._endpoint,
+            content=_dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+
+        body = _loads(response.content)
+        if body.get("error"):
+            raise JsonRpcError(body["error"])
+        return body.get("result")
+
+    def authenticate(
+        self, db: str, user: str, password: str | None, user_agent_env: dict[str, Any]
+    ) -> Any:
+        """Authenticate and remember the UID for subsequent calls."""
+        self.uid = self._call("common", "authenticate", db, user, password, user_agent_env)
+        return self.uid
+
+    def execute_kw(
+        self,
+        model: str,
+        method: str,
+        args: list[Any],
+        kwargs: dict[str, Any] | None = None,
+    ) -> Any:
+        """Call a model method, authenticating first if needed."""
+        if self.uid is None:
+            self.authenticate(self._db, self._user, self._password, {})
+            if not self.uid:
+                self.uid = None
+                raise ValueError("Authentication failed. Check your credentials.")
+
+        return self._call(
+            "object",
+            "execute_kw",
+            self._db,
+            self.uid,
+            self._password,
+            model,
+            method,
+            args,
+            kwargs or {},
+        )
 
 
 class OdooConfig(BaseModel):
     """Configuration for Odoo connection."""
     
-    model_config = {"arbitrary_types_allowed": True}
+    model_config = {"frozen": True, "arbitrary_types_allowed": True}
 
     url: str = Field(..., description="Odoo instance URL")
     database: str = Field(..., description="Odoo database name")
@@ -47,7 +270,21 @@ class OdooConfig(BaseModel):
     password: str | None = Field(None, description="Odoo password")
     api_key: str | None = Field(None, description="Odoo API key")
     timeout: int = Field(120, description="Request timeout in seconds")
+    verify_tls: bool = Field(True, description="Verify the server's TLS certificate")
+    metadata_ttl: float = Field(
+        600, description="Seconds to cache fields_get and model list results (0 disables)"
+    )
+    protocol: Literal["xmlrpc", "jsonrpc"] = Field(
+        "jsonrpc", description="RPC protocol used to talk to Odoo"
+    )
+    default_fields: dict[str, list[str]] = Field(
+        default_factory=dict,
+        description="Fields read by search_read per model when none are given",
+    )
     transport: CustomTransport | None = Field(None, description="Custom transport")
+    http_client: httpx.Client | None = Field(
+        None, description="Custom HTTP client for the JSON-RPC protocol"
+    )
 
     def model_post_init(self, __context: Any) -> None:  # pragma: no cover - pydantic hook
         """Validate that either password or api_key is provided."""
@@ -55,13 +292,43 @@ class OdooConfig(BaseModel):
             raise ValueError("Either password or api_key must be provided")
 
 
+# Single entry point for validating a config from a raw mapping (e.g. one per
+# tenant), coercing string values such as those read from the environment
+ODOO_CONFIG_ADAPTER: TypeAdapter[OdooConfig] = TypeAdapter(OdooConfig)
+
+
 class OdooClient:
     """Client for interacting with Odoo via the odooly library."""
 
+    __slots__ = (
+        "config",
+        "url",
+        "database",
+        "username",
+        "password",
+        "timeout",
+        "uid",
+        "transport",
+        "client",
+        "env",
+        "_metadata",
+        "_model_cache",
+    )
+
+    # (url, database, username, sha256(password)) -> uid, shared by all clients
+    _uid_cache: ClassVar[dict[tuple[str, str, str, str], int]] = {}
+
+    # (url, database, username) -> {cache key: (expiry, value)}, shared by all
+    # clients of the same user so a pool fetches each piece of metadata once
+    _metadata_cache: ClassVar[dict[tuple[str, str, str], dict[Any, tuple[float, Any]]]] = {}
+    _metadata_lock: ClassVar[threading.Lock] = threading.Lock()
+    # Bound per user; fields_get keys vary with the requested field lists
+    _metadata_max_entries: ClassVar[int] = 256
+
     def __init__(self, config: OdooConfig) -> None:
         """Initialize Odoo client with configuration."""
-        if OdoolyClient is None:  # pragma: no cover - handled in tests
-            raise ImportError("odooly is required to use OdooClient")
+        if config.protocol == "xmlrpc" and OdoolyClient is None:  # pragma: no cover
+            raise ImportError("odooly is required to use the xmlrpc protocol")
 
         self.config = config
         self.url = config.url.rstrip("/")
@@ -70,37 +337,105 @@ class OdooClient:
         self.password = config.api_key or config.password
         self.timeout = config.timeout
         self.uid: int | None = None
-        self.transport = config.transport or CustomTransport()
-        
-        # Initialise odooly client and environment
-        self.client = OdoolyClient(
-            self.url,
-            self.database,
-            self.username,
-            self.password,
-            transport=self.transport,
-        )
+        with self._metadata_lock:
+            self._metadata = self._metadata_cache.setdefault(
+                (self.url, self.database, self.username), {}
+            )
+        self._model_cache: dict[str, Any] = {}
+        self.transport: CustomTransport | None = None
+
+        # Initialise the RPC client and environment
+        self.client: Any
+        if config.protocol == "jsonrpc":
+            self.client = JsonRpcClient(
+                self.url,
+                self.database,
+                self.username,
+                self.password,
+                http_client=config.http_client,
+                timeout=self.timeout,
+                verify_tls=config.verify_tls,
+            )
+        else:
+            self.transport = config.transport or CustomTransport(
+                timeout=self.timeout, verify_tls=config.verify_tls
+            )
+            # odooly only routes through the transport for an /xmlrpc server URL
+            self.client = OdoolyClient(
+                self.url + "/xmlrpc/2",
+                self.database,
+                self.username,
+                self.password,
+                transport=self.transport,
+            )
         self.env = self.client.env
 
     # ------------------------------------------------------------------
     # Authentication
     # ------------------------------------------------------------------
+    def _uid_cache_key(self) -> tuple[str, str, str, str]:
+        """Key identifying these credentials without storing the secret."""
+        digest = hashlib.sha256((self.password or "").encode()).hexdigest()
+        return (self.url, self.database, self.username, digest)
+
     def authenticate(self) -> int:
-        """Authenticate with Odoo and return user ID."""
+        """Authenticate with Odoo and return user ID.
+
+        The UID is shared with other clients using the same credentials, so
+        only the first one issues the ``authenticate`` RPC.
+        """
         if self.uid is None:
-            self.uid = self.client.authenticate(
-                self.database,
-                self.username,
-                self.password,
-                {},
-            )
-            if not self.uid:
-                raise ValueError("Authentication failed. Check your credentials.")
+            key = self._uid_cache_key()
+            uid = self._uid_cache.get(key)
+            if uid is None:
+                if isinstance(self.client, JsonRpcClient):
+                    rpc_authenticate = self.client.authenticate
+                else:
+                    rpc_authenticate = self.client.common.authenticate
+                try:
+                    uid = rpc_authenticate(
+                        self.database,
+                        self.username,
+                        self.password,
+                        {},
+                    )
+                except (xmlrpc.client.Fault, JsonRpcError) as e:
+                    if _is_auth_error(e):
+                        self.invalidate_auth()
+                    raise
+                if not uid:
+                    self.invalidate_auth()
+                    raise ValueError("Authentication failed. Check your credentials.")
+                self._uid_cache[key] = uid
+            self.uid = uid
+            if isinstance(self.client, JsonRpcClient):
+                self.client.uid = uid
         return self.uid
 
+    def invalidate_auth(self) -> None:
+        """Forget the cached UID and metadata after an authentication error."""
+        self._uid_cache.pop(self._uid_cache_key(), None)
+        self.uid = None
+        if isinstance(self.client, JsonRpcClient):
+            self.client.uid = None
+        self._model_cache.clear()
+        self.clear_metadata_cache()
+
     # ------------------------------------------------------------------
     # CRUD operations
     # ------------------------------------------------------------------
+    def _m(self, name: str) -> Any:
+        """Return the model proxy for ``name``, reusing it across calls."""
+        model = self._model_cache.get(name)
+        if model is None:
+            model = self._model_cache[name] = self.env[name]
+        return model
+
+    @staticmethod
+    def _as_ids(ids: int | list[int]) -> list[int]:
+        """Normalize a single ID or a list of IDs to a list."""
+        return [ids] if type(ids) is int else cast(list[int], ids)
+
     def search(
         self,
         model: str,
@@ -109,15 +444,22 @@ class OdooClient:
         limit: int | None = None,
         order: str | None = None,
     ) -> Any:
-        """Search for record IDs matching the domain."""
+        """Search for record IDs matching the domain.
+
+        Prefer ``search_read`` when the records are read afterwards, and
+        ``count`` when only the number of matches is needed.
+        """
         domain = domain or []
+        if not offset and limit is None and order is None:
+            return self._m(model).search(domain)
+
         kwargs: dict[str, Any] = {"offset": offset}
         if limit is not None:
             kwargs["limit"] = limit
         if order is not None:
             kwargs["order"] = order
 
-        return self.env[model].search(domain, **kwargs)
+        return self._m(model).search(domain, **kwargs)
 
     def search_read(
         self,
@@ -127,34 +469,93 @@ class OdooClient:
         offset: int = 0,
         limit: int | None = None,
         order: str | None = None,
+        load: str | None = None,
     ) -> Any:
-        """Search and read records in a single call."""
+        """Search and read records in a single call.
+
+        ``fields`` falls back to ``OdooConfig.default_fields[model]``; reading
+        every field of a model is refused. Pass ``load="_classic_write"`` to
+        get many2one values as bare IDs, which spares the server a
+        ``name_get`` per record.
+        """
         domain = domain or []
-        kwargs: dict[str, Any] = {"offset": offset}
-        if fields is not None:
-            kwargs["fields"] = fields
+        kwargs: dict[str, Any] = {"offset": offset, "fields": self._projection(model, fields)}
         if limit is not None:
             kwargs["limit"] = limit
         if order is not None:
             kwargs["order"] = order
+        if load is not None:
+            kwargs["load"] = load
+
+        return self._m(model).search_read(domain, **kwargs)
+
+    def _projection(self, model: str, fields: list[str] | None) -> list[str]:
+        """Return the fields to read, refusing unbounded reads."""
+        # An empty list reads every field in Odoo, so treat it like None
+        if not fields:
+            fields = self.config.default_fields.get(model)
+        if not fields:
+            raise ValueError(
+                f"explicit fields required to read {model}; pass fields or configure "
+                "default_fields for this model"
+            )
+        return fields
+
+    def count(
+        self,
+        model: str,
+        domain: list[list[Any]] | None = None,
+    ) -> int:
+        """Count records matching the domain without transferring their IDs."""
+        return cast(int, self._m(model).search_count(domain or []))
 
-        return self.env[model].search_read(domain, **kwargs)
+    def read_group(
+        self,
+        model: str,
+        domain: list[list[Any]] | None = None,
+        fields: list[str] | None = None,
+        groupby: list[str] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        orderby: str | None = None,
+        lazy: bool = True,
+    ) -> Any:
+        """Aggregate records on the server, returning one row per group.
+
+        ``fields`` takes aggregate specs such as ``"amount_total:sum"``.
+        """
+        return self._m(model).read_group(
+            domain or [],
+            fields or [],
+            groupby or [],
+            offset=offset,
+            limit=limit,
+            orderby=orderby,
+            lazy=lazy,
+        )
 
     def read(
         self,
         model: str,
         ids: int | list[int],
         fields: list[str] | None = None,
+        load: str | None = None,
     ) -> Any:
-        """Read records by IDs."""
-        if isinstance(ids, int):
-            ids = [ids]
+        """Read records by IDs.
 
-        kwargs: dict[str, Any] = {}
-        if fields is not None:
-            kwargs["fields"] = fields
+        Pass ``load="_classic_write"`` to get many2one values as bare IDs.
+        """
+        ids = self._as_ids(ids)
+        if fields is None and load is None:
+            result = self._m(model).read(ids)
+        else:
+            kwargs: dict[str, Any] = {}
+            if fields is not None:
+                kwargs["fields"] = fields
+            if load is not None:
+                kwargs["load"] = load
+            result = self._m(model).read(ids, **kwargs)
 
-        result = self.env[model].read(ids, **kwargs)
         return result[0] if len(ids) == 1 else result
 
     def create(
@@ -169,7 +570,7 @@ class OdooClient:
         else:
             values_to_create = cast(list[dict[str, Any]], values)
 
-        result = self.env[model].create(values_to_create)
+        result = self._m(model).create(values_to_create)
         return result[0] if single_record else result
 
     def write(
@@ -179,10 +580,7 @@ class OdooClient:
         values: dict[str, Any],
     ) -> Any:
         """Update records."""
-        if isinstance(ids, int):
-            ids = [ids]
-
-        return self.env[model].write(ids, values)
+        return self._m(model).write(self._as_ids(ids), values)
 
     def unlink(
         self,
@@ -190,10 +588,7 @@ class OdooClient:
         ids: int | list[int],
     ) -> Any:
         """Delete records."""
-        if isinstance(ids, int):
-            ids = [ids]
-
-        return self.env[model].unlink(ids)
+        return self._m(model).unlink(self._as_ids(ids))
 
     def fields_get(
         self,
@@ -201,15 +596,186 @@ class OdooClient:
         fields: list[str] | None = None,
         attributes: list[str] | None = None,
     ) -> Any:
-        """Get field definitions for a model."""
+        """Get field definitions for a model, cached for ``metadata_ttl`` seconds."""
+        key = (
+            "fields_get",
+            model,
+            frozenset(fields) if fields is not None else None,
+            frozenset(attributes) if attributes is not None else None,
+        )
+        cached = self._metadata_get(key)
+        if cached is not None:
+            return cached
+
         kwargs: dict[str, Any] = {}
         if fields is not None:
             kwargs["fields"] = fields
         if attributes is not None:
             kwargs["attributes"] = attributes
 
-        return self.env[model].fields_get(**kwargs)
+        result = self._m(model).fields_get(**kwargs)
+        self._metadata_put(key, result)
+        return result
 
     def get_model_list(self) -> Any:
-        """Get list of all available models."""
-        return self.env["ir.model"].search_read([], ["model", "name", "transient"])
+        """Get list of all available models, cached for ``metadata_ttl`` seconds."""
+        key = ("model_list",)
+        cached = self._metadata_get(key)
+        if cached is not None:
+            return cached
+
+        result = self._m("ir.model").search_read([], ["model", "name", "transient"])
+        self._metadata_put(key, result)
+        return result
+
+    def _metadata_get(self, key: tuple[Any, ...]) -> Any:
+        """Return an unexpired metadata cache entry, or None."""
+        with self._metadata_lock:
+            cached = self._metadata.get(key)
+            if cached is None:
+                return None
+            if time.monotonic() >= cached[0]:
+                del self._metadata[key]
+                return None
+            return cached[1]
+
+    def _metadata_put(self, key: tuple[Any, ...], value: Any) -> None:
+        """Store a metadata cache entry for ``metadata_ttl`` seconds.
+
+        Once the cache holds ``_metadata_max_entries`` entries the oldest
+        ones are evicted.
+        """
+        if self.config.metadata_ttl > 0:
+            expiry = time.monotonic() + self.config.metadata_ttl
+            with self._metadata_lock:
+                # Re-insert so a refreshed key moves to the newest position
+                self._metadata.pop(key, None)
+                self._metadata[key] = (expiry, value)
+                while len(self._metadata) > self._metadata_max_entries:
+                    del self._metadata[next(iter(self._metadata))]
+
+    def clear_metadata_cache(self) -> None:
+        """Drop cached field definitions and model list for every client of this user."""
+        with self._metadata_lock:
+            self._metadata.clear()
+
+    # ------------------------------------------------------------------
+    # Batch operations
+    # ------------------------------------------------------------------
+    def search_then_read_many(
+        self,
+        models_domains: list[tuple[str, list[list[Any]] | None, list[str] | None]],
+    ) -> list[Any]:
+        """Search and read several ``(model, domain, fields)`` queries.
+
+        Each search+read pair is fused into a single ``search_read`` call.
+        """
+        return [
+            self._m(model).search_read(domain or [], fields=self._projection(model, fields))
+            for model, domain, fields in models_domains
+        ]
+
+
+class OdooClientPool:
+    """Bounded pool of authenticated OdooClient instances.
+
+    With XML-RPC each pooled client owns its own keep-alive transport, so
+    concurrent tool calls no longer queue up behind a single connection. With
+    JSON-RPC the clients share one HTTP client, multiplexing their requests
+    over a single HTTP/2 connection when available. The ``a*`` coroutines
+    run calls on a thread pool of the same size, so independent RPCs awaited
+    with ``asyncio.gather`` overlap their network wait.
+    """
+
+    def __init__(self, config: OdooConfig, size: int | None = None) -> None:
+        """Initialize the pool; clients are created on first use."""
+        self.config = config
+        self.size = size or min(os.cpu_count() or 1, 8)
+        self._idle: list[OdooClient] = []
+        self._created = 0
+        self._available = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="odoo-rpc")
+        self._http_client: httpx.Client | None = None
+        if config.protocol == "jsonrpc" and config.http_client is None:
+            self._http_client = _new_http_client(
+                config.timeout, max_connections=self.size, verify_tls=config.verify_tls
+            )
+            self.config = config.model_copy(update={"http_client": self._http_client})
+
+    def _new_client(self) -> OdooClient:
+        """Create and authenticate a client with a dedicated transport."""
+        config = self.config
+        if config.protocol == "xmlrpc":
+            transport = CustomTransport(timeout=config.timeout, verify_tls=config.verify_tls)
+            config = config.model_copy(update={"transport": transport})
+        client = OdooClient(config)
+        client.authenticate()
+        return client
+
+    def _checkout(self) -> OdooClient:
+        """Take an idle client, create one if below size, or wait for one."""
+        with self._available:
+            while not self._idle and self._created >= self.size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+
+        try:
+            return self._new_client()
+        except Exception:
+            # Free the slot and wake a waiter so it can retry the creation
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+
+    @contextmanager
+    def acquire(self) -> Iterator[OdooClient]:
+        """Borrow a client for the duration of the ``with`` block."""
+        client = self._checkout()
+        try:
+            yield client
+        finally:
+            with self._available:
+                self._idle.append(client)
+                self._available.notify()
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call an OdooClient method on a pooled client."""
+        with self.acquire() as client:
+            try:
+                return getattr(client, method)(*args, **kwargs)
+            except (xmlrpc.client.Fault, JsonRpcError) as e:
+                if _is_auth_error(e):
+                    client.invalidate_auth()
+                raise
+
+    async def acall(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Await an OdooClient method on a pooled client without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(self.call, method, *args, **kwargs)
+        )
+
+    async def asearch(self, *args: Any, **kwargs: Any) -> Any:
+        """Async variant of ``OdooClient.search``."""
+        return await self.acall("search", *args, **kwargs)
+
+    async def asearch_read(self, *args: Any, **kwargs: Any) -> Any:
+        """Async variant of ``OdooClient.search_read``."""
+        return await self.acall("search_read", *args, **kwargs)
+
+    async def aread(self, *args: Any, **kwargs: Any) -> Any:
+        """Async variant of ``OdooClient.read``."""
+        return await self.acall("read", *args, **kwargs)
+
+    async def afields_get(self, *args: Any, **kwargs: Any) -> Any:
+        """Async variant of ``OdooClient.fields_get``."""
+        return await self.acall("fields_get", *args, **kwargs)
+
+    def close(self) -> None:
+        """Shut down the worker threads and the shared HTTP client."""
+        self._executor.shutdown(wait=False)
+        if self._http_client is not None:
+            self._http_client.close()
@@ -10,7 +10,7 @@ from mcp.server import Server
 from mcp.types import TextContent, Tool
 from pydantic import ValidationError
 
-from .odoo_client import OdooClient, OdooConfig
+from .odoo_client import ODOO_CONFIG_ADAPTER, OdooClientPool
 
 # Load environment variables
 load_dotenv()
@@ -18,29 +18,36 @@ load_dotenv()
 # Initialize MCP server
 server = Server("odoo-mcp-server")
 
-# Global Odoo client instance
-odoo_client: OdooClient | None = None
+# Global Odoo client pool
+odoo_pool: OdooClientPool | None = None
 
 
-def get_odoo_client() -> OdooClient:
-    """Get or create Odoo client instance."""
-    global odoo_client
+def get_odoo_pool() -> OdooClientPool:
+    """Get or create the Odoo client pool."""
+    global odoo_pool
 
-    if odoo_client is None:
+    if odoo_pool is None:
         try:
-            config = OdooConfig(
-                url=os.environ["ODOO_URL"],
-                database=os.environ["ODOO_DB"],
-                username=os.environ["ODOO_USERNAME"],
-                password=os.environ.get("ODOO_PASSWORD"),
-                api_key=os.environ.get("ODOO_API_KEY"),
-                timeout=int(os.environ.get("ODOO_TIMEOUT", "120")),
+            config = ODOO_CONFIG_ADAPTER.validate_python(
+                {
+                    "url": os.environ["ODOO_URL"],
+                    "database": os.environ["ODOO_DB"],
+                    "username": os.environ["ODOO_USERNAME"],
+                    "password": os.environ.get("ODOO_PASSWORD"),
+                    "api_key": os.environ.get("ODOO_API_KEY"),
+                    "timeout": os.environ.get("ODOO_TIMEOUT", "120"),
+                    "verify_tls": os.environ.get("ODOO_VERIFY_TLS", "true"),
+                    "metadata_ttl": os.environ.get("ODOO_METADATA_TTL", "600"),
+                    "protocol": os.environ.get("ODOO_PROTOCOL", "jsonrpc"),
+                    "default_fields": json.loads(os.environ.get("ODOO_DEFAULT_FIELDS", "{}")),
+                }
             )
-            odoo_client = OdooClient(config)
-        except (KeyError, ValidationError) as e:
+            pool_size = os.environ.get("ODOO_POOL_SIZE")
+            odoo_pool = OdooClientPool(config, size=int(pool_size) if pool_size else None)
+        except (KeyError, ValueError, json.JSONDecodeError, ValidationError) as e:
             raise ValueError(f"Invalid Odoo configuration: {e}") from e
 
-    return odoo_client
+    return odoo_pool
 
 
 @server.list_tools()
@@ -65,7 +72,7 @@ async def list_tools() -> list[Tool]:
                     },
                     "fields": {
                         "type": "array",
-                        "description": "List of fields to return",
+                        "description": "List of fields to return (required unless default fields are configured for the model)",
                         "items": {"type": "string"},
                         "default": None,
                     },
@@ -84,6 +91,31 @@ async def list_tools() -> list[Tool]:
                         "description": "Sort order (e.g., 'name asc, id desc')",
                         "default": None,
                     },
+                    "load": {
+                        "type": "string",
+                        "description": "Set to '_classic_write' to return many2one fields as bare IDs instead of [id, name] pairs (faster)",
+                        "default": None,
+                    },
+                },
+                "required": ["model"],
+            },
+        ),
+        Tool(
+            name="count_records",
+            description="Count Odoo records matching a domain",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "model": {
+                        "type": "string",
+                        "description": "Odoo model name (e.g., 'res.partner', 'sale.order')",
+                    },
+                    "domain": {
+                        "type": "array",
+                        "description": "Search domain in Odoo format (e.g., [['name', 'ilike', 'john']])",
+                        "items": {"type": "array"},
+                        "default": [],
+                    },
                 },
                 "required": ["model"],
             },
@@ -169,10 +201,61 @@ async def list_tools() -> list[Tool]:
                         "items": {"type": "string"},
                         "default": None,
                     },
+                    "load": {
+                        "type": "string",
+                        "description": "Set to '_classic_write' to return many2one fields as bare IDs instead of [id, name] pairs (faster)",
+                        "default": None,
+                    },
                 },
                 "required": ["model", "ids"],
             },
         ),
+        Tool(
+            name="group_records",
+            description="Aggregate Odoo records by one or more fields (counts, sums, averages)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "model": {
+                        "type": "string",
+                        "description": "Odoo model name",
+                    },
+                    "domain": {
+                        "type": "array",
+                        "description": "Search domain in Odoo format (e.g., [['state', '=', 'sale']])",
+                        "items": {"type": "array"},
+                        "default": [],
+                    },
+                    "fields": {
+                        "type": "array",
+                        "description": "Aggregates to compute (e.g., ['amount_total:sum'])",
+                        "items": {"type": "string"},
+                        "default": [],
+                    },
+                    "groupby": {
+                        "type": "array",
+                        "description": "Fields to group by (e.g., ['partner_id', 'date_order:month'])",
+                        "items": {"type": "string"},
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of groups to return",
+                        "default": None,
+                    },
+                    "orderby": {
+                        "type": "string",
+                        "description": "Sort order of the groups (e.g., 'amount_total desc')",
+                        "default": None,
+                    },
+                    "lazy": {
+                        "type": "boolean",
+                        "description": "Group by the first field only (default: true)",
+                        "default": True,
+                    },
+                },
+                "required": ["model", "groupby"],
+            },
+        ),
         Tool(
             name="list_models",
             description="List all available Odoo models",
@@ -214,31 +297,40 @@ async def list_tools() -> list[Tool]:
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
     try:
-        client = get_odoo_client()
+        pool = get_odoo_pool()
 
         if name == "search_records":
-            result = await asyncio.to_thread(
-                client.search_read,
+            result = await pool.acall(
+                "search_read",
                 model=arguments["model"],
                 domain=arguments.get("domain", []),
                 fields=arguments.get("fields"),
                 offset=arguments.get("offset", 0),
                 limit=arguments.get("limit"),
                 order=arguments.get("order"),
+                load=arguments.get("load"),
             )
             return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
 
+        elif name == "count_records":
+            count = await pool.acall(
+                "count",
+                model=arguments["model"],
+                domain=arguments.get("domain", []),
+            )
+            return [TextContent(type="text", text=f"Matching records: {count}")]
+
         elif name == "create_record":
-            result = await asyncio.to_thread(
-                client.create,
+            result = await pool.acall(
+                "create",
                 model=arguments["model"],
                 values=arguments["values"],
             )
             return [TextContent(type="text", text=f"Created record with ID: {result}")]
 
         elif name == "update_record":
-            success = await asyncio.to_thread(
-                client.write,
+            success = await pool.acall(
+                "write",
                 model=arguments["model"],
                 ids=arguments["ids"],
                 values=arguments["values"],
@@ -251,8 +343,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             ]
 
         elif name == "delete_record":
-            success = await asyncio.to_thread(
-                client.unlink,
+            success = await pool.acall(
+                "unlink",
                 model=arguments["model"],
                 ids=arguments["ids"],
             )
@@ -264,16 +356,30 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             ]
 
         elif name == "get_record":
-            result = await asyncio.to_thread(
-                client.read,
+            result = await pool.acall(
+                "read",
                 model=arguments["model"],
                 ids=arguments["ids"],
                 fields=arguments.get("fields"),
+                load=arguments.get("load"),
+            )
+            return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+
+        elif name == "group_records":
+            result = await pool.acall(
+                "read_group",
+                model=arguments["model"],
+                domain=arguments.get("domain", []),
+                fields=arguments.get("fields", []),
+                groupby=arguments["groupby"],
+                limit=arguments.get("limit"),
+                orderby=arguments.get("orderby"),
+                lazy=arguments.get("lazy", True),
             )
             return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
 
         elif name == "list_models":
-            models = await asyncio.to_thread(client.get_model_list)
+            models = await pool.acall("get_model_list")
             if not arguments.get("transient", False):
                 models = [m for m in models if not m.get("transient", False)]
 
@@ -285,8 +391,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             return [TextContent(type="text", text=output)]
 
         elif name == "get_model_fields":
-            fields = await asyncio.to_thread(
-                client.fields_get,
+            fields = await pool.acall(
+                "fields_get",
                 model=arguments["model"],
                 fields=arguments.get("fields"),
             )
@@ -1,21 +1,49 @@
 """Tests for Odoo client based on odooly."""
 
+import asyncio
+import gzip
+import io
+import json
+import ssl
+import threading
+import xmlrpc.client
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+from pydantic import ValidationError
 
-from mcp_server_odoo.odoo_client import OdooClient, OdooConfig
+from mcp_server_odoo.odoo_client import (
+    ODOO_CONFIG_ADAPTER,
+    CustomTransport,
+    JsonRpcClient,
+    JsonRpcError,
+    OdooClient,
+    OdooClientPool,
+    OdooConfig,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_caches():
+    """Isolate the class-level UID and metadata caches between tests."""
+    OdooClient._uid_cache.clear()
+    OdooClient._metadata_cache.clear()
+    yield
+    OdooClient._uid_cache.clear()
+    OdooClient._metadata_cache.clear()
 
 
 @pytest.fixture
 def odoo_config():
-    """Create test Odoo configuration."""
+    """Create test Odoo configuration for the odooly (XML-RPC) backend."""
     return OdooConfig(
         url="https://test.odoo.com",
         database="test_db",
         username="test_user",
         password="test_pass",
         timeout=60,
+        protocol="xmlrpc",
     )
 
 
@@ -25,7 +53,7 @@ def odoo_client(odoo_config):
     with patch("mcp_server_odoo.odoo_client.OdoolyClient") as mock_client_cls:
         mock_client = mock_client_cls.return_value
         mock_client.env = MagicMock()
-        mock_client.authenticate = MagicMock(return_value=123)
+        mock_client.common.authenticate = MagicMock(return_value=123)
         client = OdooClient(odoo_config)
         return client
 
@@ -55,6 +83,25 @@ class TestOdooConfig:
         assert config.api_key == "test_key"
         assert config.password is None
 
+    def test_config_adapter(self):
+        """Test validating a config from a raw mapping."""
+        config = ODOO_CONFIG_ADAPTER.validate_python(
+            {
+                "url": "https://test.odoo.com",
+                "database": "test_db",
+                "username": "test_user",
+                "api_key": "test_key",
+                "timeout": "30",
+            }
+        )
+        assert isinstance(config, OdooConfig)
+        assert config.timeout == 30
+
+    def test_config_is_frozen(self, odoo_config):
+        """Test that configuration cannot be mutated after creation."""
+        with pytest.raises(ValidationError):
+            odoo_config.timeout = 10
+
     def test_invalid_config_no_auth(self):
         """Test config without password or API key."""
         with pytest.raises(ValueError, match="Either password or api_key must be provided"):
@@ -65,6 +112,185 @@ class TestOdooConfig:
             )
 
 
+class TestCustomTransport:
+    """Test CustomTransport connection handling."""
+
+    def test_make_connection_reuses_connection(self):
+        """Test that the same host reuses the cached keep-alive connection."""
+        transport = CustomTransport(timeout=30)
+
+        first = transport.make_connection("test.odoo.com")
+        second = transport.make_connection("test.odoo.com")
+
+        assert first is second
+        assert first.timeout == 30
+
+    def test_tls_context_shared(self):
+        """Test that transports share one verifying SSL context by default."""
+        first = CustomTransport()
+        second = CustomTransport()
+        insecure = CustomTransport(verify_tls=False)
+
+        assert first.context is second.context
+        assert first.context.verify_mode == ssl.CERT_REQUIRED
+        assert insecure.context.verify_mode == ssl.CERT_NONE
+
+    def test_make_connection_new_host(self):
+        """Test that a different host replaces the cached connection."""
+        transport = CustomTransport()
+
+        first = transport.make_connection("test.odoo.com")
+        second = transport.make_connection("other.odoo.com")
+
+        assert first is not second
+        assert second.host == "other.odoo.com"
+
+    def test_send_headers_keep_alive(self):
+        """Test that keep-alive is requested on every RPC."""
+        transport = CustomTransport()
+        connection = MagicMock()
+
+        transport.send_headers(connection, [("Content-Type", "text/xml")])
+
+        connection.putheader.assert_any_call("Connection", "keep-alive")
+        connection.putheader.assert_any_call("Content-Type", "text/xml")
+
+    def test_send_request_accepts_gzip(self):
+        """Test that RPC requests advertise gzip response encoding."""
+        transport = CustomTransport()
+        connection = MagicMock()
+
+        with patch.object(transport, "make_connection", return_value=connection):
+            transport.send_request("test.odoo.com", "/xmlrpc/2/object", b"<x/>", False)
+
+        connection.putheader.assert_any_call("Accept-Encoding", "gzip")
+
+    def test_parse_gzip_response(self):
+        """Test that gzip-encoded responses are decompressed."""
+        body = xmlrpc.client.dumps(([{"id": 1}],), methodresponse=True).encode()
+        response = MagicMock()
+        response.getheader.return_value = "gzip"
+        response.read.side_effect = io.BytesIO(gzip.compress(body)).read
+        transport = CustomTransport()
+        transport.verbose = False
+
+        result = transport.parse_response(response)
+
+        assert result == ([{"id": 1}],)
+
+    def test_send_headers_custom_header(self, monkeypatch):
+        """Test that the custom header is read once and sent on every RPC."""
+        monkeypatch.setenv("ODOO_CUSTOM_HEADER_NAME", "X-Tenant")
+        monkeypatch.setenv("ODOO_CUSTOM_HEADER_VALUE", "acme")
+        transport = CustomTransport()
+        monkeypatch.delenv("ODOO_CUSTOM_HEADER_NAME")
+        connection = MagicMock()
+
+        transport.send_headers(connection, [])
+
+        connection.putheader.assert_any_call("X-Tenant", "acme")
+
+
+class TestJsonRpcClient:
+    """Test the JSON-RPC transport against a mocked /jsonrpc endpoint."""
+
+    @pytest.fixture
+    def requests(self):
+        """Collect decoded JSON-RPC requests."""
+        return []
+
+    @pytest.fixture
+    def http_client(self, requests):
+        """Create an HTTP client answering like an Odoo /jsonrpc endpoint."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            requests.append(payload)
+            params = payload["params"]
+            if params["method"] == "authenticate":
+                result = 7 if params["args"][2] == "test_pass" else False
+                return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "result": result})
+            if params["args"][4] == "missing":
+                error = {
+                    "code": 200,
+                    "message": "Odoo Server Error",
+                    "data": {"name": "builtins.AttributeError", "message": "no method"},
+                }
+                return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "error": error})
+            return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "result": [{"id": 1}]})
+
+        return httpx.Client(transport=httpx.MockTransport(handler))
+
+    def test_execute_kw_authenticates_first(self, http_client, requests):
+        """Test that the first call authenticates and reuses the UID."""
+        client = JsonRpcClient(
+            "https://test.odoo.com", "test_db", "test_user", "test_pass", http_client=http_client
+        )
+
+        result = client.env["res.partner"].search_read([], fields=["name"])
+        client.env["res.partner"].search_read([])
+
+        assert result == [{"id": 1}]
+        assert [r["params"]["method"] for r in requests] == [
+            "authenticate",
+            "execute_kw",
+            "execute_kw",
+        ]
+        assert requests[1]["params"]["args"] == [
+            "test_db",
+            7,
+            "test_pass",
+            "res.partner",
+            "search_read",
+            [[]],
+            {"fields": ["name"]},
+        ]
+
+    def test_authentication_failure(self, http_client):
+        """Test that rejected credentials raise ValueError."""
+        client = JsonRpcClient(
+            "https://test.odoo.com", "test_db", "test_user", "wrong", http_client=http_client
+        )
+
+        with pytest.raises(ValueError, match="Authentication failed"):
+            client.env["res.partner"].search([])
+        assert client.uid is None
+
+    def test_error_response(self, http_client):
+        """Test that a JSON-RPC error is raised as JsonRpcError."""
+        client = JsonRpcClient(
+            "https://test.odoo.com", "test_db", "test_user", "test_pass", http_client=http_client
+        )
+
+        with pytest.raises(JsonRpcError, match="no method") as exc_info:
+            client.env["res.partner"].missing()
+        assert exc_info.value.name == "builtins.AttributeError"
+
+    def test_stdlib_json_fallback(self, http_client):
+        """Test that the transport works without orjson installed."""
+        client = JsonRpcClient(
+            "https://test.odoo.com", "test_db", "test_user", "test_pass", http_client=http_client
+        )
+
+        with patch("mcp_server_odoo.odoo_client.orjson", None):
+            assert client.env["res.partner"].search_read([]) == [{"id": 1}]
+
+    def test_odoo_client_uses_jsonrpc(self, http_client, requests):
+        """Test that OdooClient routes calls through JSON-RPC by default."""
+        config = OdooConfig(
+            url="https://test.odoo.com",
+            database="test_db",
+            username="test_user",
+            password="test_pass",
+            http_client=http_client,
+        )
+        client = OdooClient(config)
+
+        assert client.authenticate() == 7
+        assert client.search_read("res.partner", fields=["name"]) == [{"id": 1}]
+        assert [r["params"]["method"] for r in requests] == ["authenticate", "execute_kw"]
+
+
 class TestOdooClient:
     """Test OdooClient methods."""
 
@@ -73,15 +299,80 @@ class TestOdooClient:
         uid = odoo_client.authenticate()
         assert uid == 123
         assert odoo_client.uid == 123
-        odoo_client.client.authenticate.assert_called_once()
+        odoo_client.client.common.authenticate.assert_called_once()
 
     def test_authenticate_failure(self, odoo_client):
         """Test authentication failure."""
-        odoo_client.client.authenticate.return_value = False
+        odoo_client.client.common.authenticate.return_value = False
         odoo_client.uid = None
         with pytest.raises(ValueError, match="Authentication failed"):
             odoo_client.authenticate()
 
+    def test_authenticate_reuses_cached_uid(self, odoo_client, odoo_config):
+        """Test that clients with the same credentials share the UID."""
+        odoo_client.authenticate()
+
+        with patch("mcp_server_odoo.odoo_client.OdoolyClient") as mock_client_cls:
+            other = OdooClient(odoo_config)
+            assert other.authenticate() == 123
+            mock_client_cls.return_value.common.authenticate.assert_not_called()
+
+    def test_authenticate_fault_invalidates_cache(self, odoo_client):
+        """Test that an access-denied fault resets authentication state."""
+        odoo_client._metadata[("model_list",)] = (float("inf"), [])
+        odoo_client.client.common.authenticate.side_effect = xmlrpc.client.Fault(3, "Access Denied")
+
+        with pytest.raises(xmlrpc.client.Fault):
+            odoo_client.authenticate()
+
+        assert odoo_client.uid is None
+        assert odoo_client._metadata == {}
+
+    def test_odooly_routes_through_custom_transport(self, odoo_config):
+        """Test that the installed odooly sends XML-RPC through CustomTransport."""
+        handlers = []
+
+        def fake_request(self, host, handler, body, verbose=False):
+            handlers.append(handler)
+            params, method = xmlrpc.client.loads(body)
+            if method == "version":
+                return ({"server_version": "17.0"},)
+            if method == "list":
+                return (["test_db"],)
+            if method in ("login", "authenticate"):
+                return (7,)
+            model, model_method = params[3], params[4]
+            if model_method == "context_get":
+                return ({},)
+            if model == "ir.model":
+                return ([{"model": "res.partner", "transient": False}],)
+            if model_method == "fields_get":
+                return ({"name": {"type": "char"}},)
+            return ([{"id": 1, "name": "A"}],)
+
+        with patch.object(CustomTransport, "request", fake_request):
+            client = OdooClient(odoo_config)
+            assert client.authenticate() == 7
+            assert client.search_read("res.partner", [], ["name"]) == [{"id": 1, "name": "A"}]
+
+        assert isinstance(client.transport, CustomTransport)
+        assert set(handlers) == {"/xmlrpc/2/common", "/xmlrpc/2/db", "/xmlrpc/2/object"}
+
+    def test_model_handle_cached(self, odoo_client):
+        """Test that the model proxy is looked up once per model."""
+        odoo_client.search("res.partner")
+        odoo_client.count("res.partner")
+
+        odoo_client.env.__getitem__.assert_called_once_with("res.partner")
+
+    def test_model_handle_cache_cleared_on_invalidate(self, odoo_client):
+        """Test that invalidating authentication drops cached model proxies."""
+        odoo_client.search("res.partner")
+        odoo_client.invalidate_auth()
+        odoo_client.search("res.partner")
+
+        assert odoo_client.env.__getitem__.call_count == 2
+
     def test_search_records(self, odoo_client):
         """Test search method."""
         model = MagicMock()
@@ -100,6 +391,16 @@ class TestOdooClient:
             [["name", "ilike", "test"]], offset=0, limit=10, order="name asc"
         )
 
+    def test_search_without_options(self, odoo_client):
+        """Test that search without options passes only the domain."""
+        model = MagicMock()
+        model.search.return_value = [1]
+        odoo_client.env.__getitem__.return_value = model
+
+        odoo_client.search("res.partner")
+
+        model.search.assert_called_once_with([])
+
     def test_search_read(self, odoo_client):
         """Test search_read method."""
         model = MagicMock()
@@ -125,6 +426,91 @@ class TestOdooClient:
             limit=5,
         )
 
+    def test_search_read_requires_fields(self, odoo_client):
+        """Test that search_read refuses to read every field."""
+        model = MagicMock()
+        odoo_client.env.__getitem__.return_value = model
+
+        with pytest.raises(ValueError, match="explicit fields required"):
+            odoo_client.search_read("res.partner")
+
+        model.search_read.assert_not_called()
+
+    def test_search_read_rejects_empty_fields(self, odoo_client):
+        """Test that an empty field list is refused, since Odoo reads every field."""
+        model = MagicMock()
+        odoo_client.env.__getitem__.return_value = model
+
+        with pytest.raises(ValueError, match="explicit fields required"):
+            odoo_client.search_read("res.partner", fields=[])
+        with pytest.raises(ValueError, match="explicit fields required"):
+            odoo_client.search_then_read_many([("res.partner", None, [])])
+
+        model.search_read.assert_not_called()
+
+    def test_search_read_default_fields(self, odoo_config):
+        """Test that configured default fields are used when none are given."""
+        config = odoo_config.model_copy(update={"default_fields": {"res.partner": ["name"]}})
+        with patch("mcp_server_odoo.odoo_client.OdoolyClient"):
+            client = OdooClient(config)
+        model = MagicMock()
+        client.env.__getitem__.return_value = model
+
+        client.search_read("res.partner")
+
+        model.search_read.assert_called_once_with([], offset=0, fields=["name"])
+
+    def test_search_read_load(self, odoo_client):
+        """Test that load is forwarded to search_read."""
+        model = MagicMock()
+        model.search_read.return_value = [{"id": 1, "partner_id": 3}]
+        odoo_client.env.__getitem__.return_value = model
+
+        odoo_client.search_read("sale.order", fields=["partner_id"], load="_classic_write")
+
+        model.search_read.assert_called_once_with(
+            [], offset=0, fields=["partner_id"], load="_classic_write"
+        )
+
+    def test_count(self, odoo_client):
+        """Test counting records."""
+        model = MagicMock()
+        model.search_count.return_value = 42
+        odoo_client.env.__getitem__.return_value = model
+
+        result = odoo_client.count("res.partner", [["active", "=", True]])
+
+        assert result == 42
+        model.search_count.assert_called_once_with([["active", "=", True]])
+
+    def test_read_group(self, odoo_client):
+        """Test read_group method."""
+        model = MagicMock()
+        expected = [
+            {"partner_id": [1, "Azure"], "partner_id_count": 3, "amount_total": 300.0},
+        ]
+        model.read_group.return_value = expected
+        odoo_client.env.__getitem__.return_value = model
+
+        result = odoo_client.read_group(
+            "sale.order",
+            [["state", "=", "sale"]],
+            fields=["amount_total:sum"],
+            groupby=["partner_id"],
+            limit=5,
+        )
+
+        assert result == expected
+        model.read_group.assert_called_once_with(
+            [["state", "=", "sale"]],
+            ["amount_total:sum"],
+            ["partner_id"],
+            offset=0,
+            limit=5,
+            orderby=None,
+            lazy=True,
+        )
+
     def test_read_single_record(self, odoo_client):
         """Test reading a single record."""
         model = MagicMock()
@@ -136,6 +522,16 @@ class TestOdooClient:
         assert result == {"id": 1, "name": "Test"}
         model.read.assert_called_once_with([1], fields=["name"])
 
+    def test_read_without_fields(self, odoo_client):
+        """Test that read without options passes only the IDs."""
+        model = MagicMock()
+        model.read.return_value = [{"id": 1}, {"id": 2}]
+        odoo_client.env.__getitem__.return_value = model
+
+        odoo_client.read("res.partner", [1, 2])
+
+        model.read.assert_called_once_with([1, 2])
+
     def test_read_multiple_records(self, odoo_client):
         """Test reading multiple records."""
         model = MagicMock()
@@ -148,6 +544,17 @@ class TestOdooClient:
         assert result == expected
         model.read.assert_called_once_with([1, 2], fields=["name"])
 
+    def test_read_load(self, odoo_client):
+        """Test that load is forwarded to read."""
+        model = MagicMock()
+        model.read.return_value = [{"id": 1, "partner_id": 3}]
+        odoo_client.env.__getitem__.return_value = model
+
+        result = odoo_client.read("sale.order", 1, ["partner_id"], load="_classic_write")
+
+        assert result == {"id": 1, "partner_id": 3}
+        model.read.assert_called_once_with([1], fields=["partner_id"], load="_classic_write")
+
     def test_create_single_record(self, odoo_client):
         """Test creating a single record."""
         model = MagicMock()
@@ -188,6 +595,15 @@ class TestOdooClient:
         assert result is True
         model.write.assert_called_once_with([1, 2], {"active": False})
 
+    def test_write_single_id(self, odoo_client):
+        """Test that a single ID is wrapped in a list."""
+        model = MagicMock()
+        odoo_client.env.__getitem__.return_value = model
+
+        odoo_client.write("res.partner", 7, {"active": False})
+
+        model.write.assert_called_once_with([7], {"active": False})
+
     def test_unlink_records(self, odoo_client):
         """Test deleting records."""
         model = MagicMock()
@@ -214,6 +630,80 @@ class TestOdooClient:
         assert result == expected
         model.fields_get.assert_called_once_with(fields=["name", "email"])
 
+    def test_fields_get_cached(self, odoo_client):
+        """Test that repeated fields_get calls are served from the cache."""
+        model = MagicMock()
+        model.fields_get.return_value = {"name": {"type": "char"}}
+        odoo_client.env.__getitem__.return_value = model
+
+        first = odoo_client.fields_get("res.partner", ["name"])
+        second = odoo_client.fields_get("res.partner", ["name"])
+        odoo_client.fields_get("res.partner", ["email"])
+
+        assert first is second
+        assert model.fields_get.call_count == 2
+
+    def test_fields_get_cache_expires(self, odoo_client):
+        """Test that cached field definitions are refetched after the TTL."""
+        model = MagicMock()
+        odoo_client.env.__getitem__.return_value = model
+
+        with patch("mcp_server_odoo.odoo_client.time.monotonic", side_effect=[0, 601, 601]):
+            odoo_client.fields_get("res.partner")
+            odoo_client.fields_get("res.partner")
+
+        assert model.fields_get.call_count == 2
+
+    def test_metadata_cache_drops_expired_entry(self, odoo_client):
+        """Test that an expired entry is removed from the shared cache on lookup."""
+        odoo_client._metadata[("fields_get", "res.partner", None, None)] = (0, {})
+
+        with patch("mcp_server_odoo.odoo_client.time.monotonic", return_value=1):
+            assert odoo_client._metadata_get(("fields_get", "res.partner", None, None)) is None
+
+        assert odoo_client._metadata == {}
+
+    def test_metadata_cache_evicts_oldest(self, odoo_client, monkeypatch):
+        """Test that the per-user metadata cache is bounded."""
+        monkeypatch.setattr(OdooClient, "_metadata_max_entries", 2)
+        odoo_client.env.__getitem__.return_value = MagicMock()
+
+        for name in ("name", "email", "phone"):
+            odoo_client.fields_get("res.partner", [name])
+
+        assert list(odoo_client._metadata) == [
+            ("fields_get", "res.partner", frozenset(["email"]), None),
+            ("fields_get", "res.partner", frozenset(["phone"]), None),
+        ]
+
+    def test_metadata_cache_shared_between_clients(self, odoo_client, odoo_config):
+        """Test that clients of the same user share cached metadata."""
+        model = MagicMock()
+        model.search_read.return_value = [{"model": "res.partner"}]
+        odoo_client.env.__getitem__.return_value = model
+        odoo_client.get_model_list()
+
+        with patch("mcp_server_odoo.odoo_client.OdoolyClient"):
+            other = OdooClient(odoo_config)
+        result = other.get_model_list()
+
+        assert result == [{"model": "res.partner"}]
+        other.env.__getitem__.assert_not_called()
+
+        other.invalidate_auth()
+        assert odoo_client._metadata == {}
+
+    def test_metadata_cache_cleared_on_auth_failure(self, odoo_client):
+        """Test that a failed authentication drops cached metadata."""
+        odoo_client.env.__getitem__.return_value = MagicMock()
+        odoo_client.get_model_list()
+        odoo_client.client.common.authenticate.return_value = False
+
+        with pytest.raises(ValueError, match="Authentication failed"):
+            odoo_client.authenticate()
+
+        assert odoo_client._metadata == {}
+
     def test_get_model_list(self, odoo_client):
         """Test getting model list."""
         model = MagicMock()
@@ -228,3 +718,146 @@ class TestOdooClient:
 
         assert result == expected
         model.search_read.assert_called_once_with([], ["model", "name", "transient"])
+
+    def test_search_then_read_many(self, odoo_client):
+        """Test that each search+read pair becomes one search_read call."""
+        model = MagicMock()
+        model.search_read.side_effect = [[{"id": 1}], [{"id": 7}]]
+        odoo_client.env.__getitem__.return_value = model
+
+        result = odoo_client.search_then_read_many(
+            [
+                ("res.partner", [["active", "=", True]], ["name"]),
+                ("sale.order", None, ["name"]),
+            ]
+        )
+
+        assert result == [[{"id": 1}], [{"id": 7}]]
+        assert model.search_read.call_count == 2
+        model.search_read.assert_any_call([["active", "=", True]], fields=["name"])
+        model.search_read.assert_any_call([], fields=["name"])
+
+
+class TestOdooClientPool:
+    """Test OdooClientPool checkout behaviour."""
+
+    @pytest.fixture
+    def pool(self, odoo_config):
+        """Create a two-client pool with mocked odooly backend."""
+        with patch("mcp_server_odoo.odoo_client.OdoolyClient") as mock_client_cls:
+            mock_client_cls.side_effect = lambda *args, **kwargs: MagicMock(
+                **{"common.authenticate.return_value": 123}
+            )
+            yield OdooClientPool(odoo_config, size=2)
+
+    def test_acquire_reuses_idle_client(self, pool):
+        """Test that a released client is handed out again."""
+        with pool.acquire() as first:
+            assert first.uid == 123
+        with pool.acquire() as second:
+            pass
+
+        assert first is second
+        assert pool._created == 1
+
+    def test_acquire_creates_up_to_size(self, pool):
+        """Test that concurrent checkouts get distinct clients and transports."""
+        with pool.acquire() as first, pool.acquire() as second:
+            assert first is not second
+            assert first.transport is not second.transport
+
+        assert pool._created == 2
+
+    def test_failed_creation_wakes_waiter(self, odoo_config):
+        """Test that a caller waiting for a slot is not stranded by a failed creation."""
+        pool = OdooClientPool(odoo_config, size=1)
+        creating = threading.Event()
+        release = threading.Event()
+        errors: list[Exception] = []
+
+        def failing_authenticate(self):
+            creating.set()
+            release.wait(5)
+            raise ValueError("Authentication failed. Check your credentials.")
+
+        def worker():
+            try:
+                pool.call("count", "res.partner")
+            except ValueError as e:
+                errors.append(e)
+
+        with (
+            patch("mcp_server_odoo.odoo_client.OdoolyClient"),
+            patch.object(OdooClient, "authenticate", failing_authenticate),
+        ):
+            first = threading.Thread(target=worker, daemon=True)
+            first.start()
+            creating.wait(5)
+            second = threading.Thread(target=worker, daemon=True)
+            second.start()
+            release.set()
+            first.join(5)
+            second.join(5)
+
+        assert not first.is_alive()
+        assert not second.is_alive()
+        assert len(errors) == 2
+        assert pool._created == 0
+        pool.close()
+
+    def test_call(self, pool):
+        """Test calling a client method through the pool."""
+        with pool.acquire() as client:
+            client.env = MagicMock()
+            client.env.__getitem__.return_value.search_count.return_value = 5
+
+        result = pool.call("count", "res.partner", [["active", "=", True]])
+
+        assert result == 5
+
+    def test_call_auth_fault_invalidates_client(self, pool):
+        """Test that an access-denied fault resets the client's authentication."""
+        with pool.acquire() as client:
+            client.env = MagicMock()
+            model = client.env.__getitem__.return_value
+            model.search_count.side_effect = xmlrpc.client.Fault(3, "Access Denied")
+
+        with pytest.raises(xmlrpc.client.Fault):
+            pool.call("count", "res.partner")
+
+        assert client.uid is None
+        assert OdooClient._uid_cache == {}
+
+    async def test_async_fan_out(self, pool):
+        """Test that async calls run concurrently on separate pooled clients."""
+        with pool.acquire() as first, pool.acquire() as second:
+            for client in (first, second):
+                client.env = MagicMock()
+                model = client.env.__getitem__.return_value
+                model.search_read.return_value = [{"id": 1}]
+                model.fields_get.return_value = {"name": {"type": "char"}}
+
+        records, fields = await asyncio.gather(
+            pool.asearch_read("res.partner", fields=["name"]),
+            pool.afields_get("res.partner"),
+        )
+
+        assert records == [{"id": 1}]
+        assert fields == {"name": {"type": "char"}}
+        pool.close()
+
+    def test_jsonrpc_clients_share_http_client(self, odoo_config):
+        """Test that JSON-RPC pooled clients share one multiplexed HTTP client."""
+        config = odoo_config.model_copy(update={"protocol": "jsonrpc"})
+        pool = OdooClientPool(config, size=2)
+
+        with (
+            patch.object(OdooClient, "authenticate"),
+            pool.acquire() as first,
+            pool.acquire() as second,
+        ):
+            assert first.client._http is pool._http_client
+            assert second.client._http is pool._http_client
+            assert first.transport is None
+
+        pool.close()
@@ -1,11 +1,12 @@
 """Tests for MCP server."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from mcp_server_odoo.server import call_tool
+from mcp_server_odoo import server
+from mcp_server_odoo.server import call_tool, get_odoo_pool
 
 
 @pytest.fixture
@@ -13,15 +14,29 @@ def mock_odoo_client():
     """Create mock Odoo client."""
     client = MagicMock()
     client.search_read = MagicMock()
+    client.count = MagicMock()
     client.create = MagicMock()
     client.write = MagicMock()
     client.unlink = MagicMock()
     client.read = MagicMock()
+    client.read_group = MagicMock()
     client.get_model_list = MagicMock()
     client.fields_get = MagicMock()
     return client
 
 
+@pytest.fixture
+def mock_odoo_pool(mock_odoo_client):
+    """Create mock Odoo client pool dispatching to the mock client."""
+    pool = MagicMock()
+    pool.acall = AsyncMock(
+        side_effect=lambda method, *args, **kwargs: getattr(mock_odoo_client, method)(
+            *args, **kwargs
+        )
+    )
+    return pool
+
+
 @pytest.fixture
 def mock_env(monkeypatch):
     """Set up environment variables."""
@@ -48,17 +63,19 @@ class TestServer:
 
         tool_names = [tool.name for tool in tools]
         assert "search_records" in tool_names
+        assert "count_records" in tool_names
         assert "create_record" in tool_names
         assert "update_record" in tool_names
         assert "delete_record" in tool_names
         assert "get_record" in tool_names
+        assert "group_records" in tool_names
         assert "list_models" in tool_names
         assert "get_model_fields" in tool_names
 
     @pytest.mark.anyio
-    async def test_search_records_tool(self, mock_odoo_client, mock_env):
+    async def test_search_records_tool(self, mock_odoo_client, mock_odoo_pool, mock_env):
         """Test search_records tool."""
-        with patch("mcp_server_odoo.server.get_odoo_client", return_value=mock_odoo_client):
+        with patch("mcp_server_odoo.server.get_odoo_pool", return_value=mock_odoo_pool):
             mock_odoo_client.search_read.return_value = [
                 {"id": 1, "name": "Test Partner"},
                 {"id": 2, "name": "Another Partner"},
@@ -81,9 +98,26 @@ class TestServer:
             assert data[0]["name"] == "Test Partner"
 
     @pytest.mark.anyio
-    async def test_create_record_tool(self, mock_odoo_client, mock_env):
+    async def test_count_records_tool(self, mock_odoo_client, mock_odoo_pool, mock_env):
+        """Test count_records tool."""
+        with patch("mcp_server_odoo.server.get_odoo_pool", return_value=mock_odoo_pool):
+            mock_odoo_client.count.return_value = 7
+
+            result = await call_tool(
+                "count_records",
+                {"model": "res.partner", "domain": [["active", "=", True]]},
+            )
+
+            assert len(result) == 1
+            assert "Matching records: 7" in result[0].text
+            mock_odoo_client.count.assert_called_once_with(
+                model="res.partner", domain=[["active", "=", True]]
+            )
+
+    @pytest.mark.anyio
+    async def test_create_record_tool(self, mock_odoo_client, mock_odoo_pool, mock_env):
         """Test create_record tool."""
-        with patch("mcp_server_odoo.server.get_odoo_client", return_value=mock_odoo_client):
+        with patch("mcp_server_odoo.server.get_odoo_pool", return_value=mock_odoo_pool):
             mock_odoo_client.create.return_value = 42
 
             result = await call_tool(
@@ -98,9 +132,9 @@ class TestServer:
             assert "Created record with ID: 42" in result[0].text
 
     @pytest.mark.anyio
-    async def test_update_record_tool(self, mock_odoo_client, mock_env):
+    async def test_update_record_tool(self, mock_odoo_client, mock_odoo_pool, mock_env):
         """Test update_record tool."""
-        with patch("mcp_server_odoo.server.get_odoo_client", return_value=mock_odoo_client):
+        with patch("mcp_server_odoo.server.get_odoo_pool", return_value=mock_odoo_pool):
             mock_odoo_client.write.return_value = True
 
             result = await call_tool(
@@ -112,9 +146,9 @@ class TestServer:
             assert "Update successful" in result[0].text
 
     @pytest.mark.anyio
-    async def test_delete_record_tool(self, mock_odoo_client, mock_env):
+    async def test_delete_record_tool(self, mock_odoo_client, mock_odoo_pool, mock_env):
         """Test delete_record tool."""
-        with patch("mcp_server_odoo.server.get_odoo_client", return_value=mock_odoo_client):
+        with patch("mcp_server_odoo.server.get_odoo_pool", return_value=mock_odoo_pool):
             mock_odoo_client.unlink.return_value = True
 
             result = await call_tool("delete_record", {"model": "res.partner", "ids": [1, 2]})
@@ -123,9 +157,9 @@ class TestServer:
             assert "Delete successful" in result[0].text
 
     @pytest.mark.anyio
-    async def test_get_record_tool(self, mock_odoo_client, mock_env):
+    async def test_get_record_tool(self, mock_odoo_client, mock_odoo_pool, mock_env):
         """Test get_record tool."""
-        with patch("mcp_server_odoo.server.get_odoo_client", return_value=mock_odoo_client):
+        with patch("mcp_server_odoo.server.get_odoo_pool", return_value=mock_odoo_pool):
             mock_odoo_client.read.return_value = {"id": 1, "name": "Test Partner"}
 
             result = await call_tool(
@@ -138,9 +172,54 @@ class TestServer:
             assert data["name"] == "Test Partner"
 
     @pytest.mark.anyio
-    async def test_list_models_tool(self, mock_odoo_client, mock_env):
+    async def test_get_record_tool_load(self, mock_odoo_client, mock_odoo_pool, mock_env):
+        """Test that get_record forwards load to the client."""
+        with patch("mcp_server_odoo.server.get_odoo_pool", return_value=mock_odoo_pool):
+            mock_odoo_client.read.return_value = {"id": 1, "partner_id": 3}
+
+            await call_tool(
+                "get_record",
+                {"model": "sale.order", "ids": [1], "load": "_classic_write"},
+            )
+
+            mock_odoo_client.read.assert_called_once_with(
+                model="sale.order", ids=[1], fields=None, load="_classic_write"
+            )
+
+    @pytest.mark.anyio
+    async def test_group_records_tool(self, mock_odoo_client, mock_odoo_pool, mock_env):
+        """Test group_records tool."""
+        with patch("mcp_server_odoo.server.get_odoo_pool", return_value=mock_odoo_pool):
+            mock_odoo_client.read_group.return_value = [
+                {"partner_id": [1, "Azure"], "partner_id_count": 3, "amount_total": 300.0},
+            ]
+
+            result = await call_tool(
+                "group_records",
+                {
+                    "model": "sale.order",
+                    "fields": ["amount_total:sum"],
+                    "groupby": ["partner_id"],
+                },
+            )
+
+            assert len(result) == 1
+            data = json.loads(result[0].text)
+            assert data[0]["amount_total"] == 300.0
+            mock_odoo_client.read_group.assert_called_once_with(
+                model="sale.order",
+                domain=[],
+                fields=["amount_total:sum"],
+                groupby=["partner_id"],
+                limit=None,
+                orderby=None,
+                lazy=True,
+            )
+
+    @pytest.mark.anyio
+    async def test_list_models_tool(self, mock_odoo_client, mock_odoo_pool, mock_env):
         """Test list_models tool."""
-        with patch("mcp_server_odoo.server.get_odoo_client", return_value=mock_odoo_client):
+        with patch("mcp_server_odoo.server.get_odoo_pool", return_value=mock_odoo_pool):
             mock_odoo_client.get_model_list.return_value = [
                 {"model": "res.partner", "name": "Contact", "transient": False},
                 {"model": "sale.order", "name": "Sales Order", "transient": False},
@@ -155,9 +234,9 @@ class TestServer:
             assert "wizard.test" not in result[0].text
 
     @pytest.mark.anyio
-    async def test_get_model_fields_tool(self, mock_odoo_client, mock_env):
+    async def test_get_model_fields_tool(self, mock_odoo_client, mock_odoo_pool, mock_env):
         """Test get_model_fields tool."""
-        with patch("mcp_server_odoo.server.get_odoo_client", return_value=mock_odoo_client):
+        with patch("mcp_server_odoo.server.get_odoo_pool", return_value=mock_odoo_pool):
             mock_odoo_client.fields_get.return_value = {
                 "name": {"type": "char", "string": "Name"},
                 "email": {"type": "char", "string": "Email"},
@@ -173,9 +252,9 @@ class TestServer:
             assert data["name"]["type"] == "char"
 
     @pytest.mark.anyio
-    async def test_error_handling(self, mock_odoo_client, mock_env):
+    async def test_error_handling(self, mock_odoo_client, mock_odoo_pool, mock_env):
         """Test error handling in tools."""
-        with patch("mcp_server_odoo.server.get_odoo_client", return_value=mock_odoo_client):
+        with patch("mcp_server_odoo.server.get_odoo_pool", return_value=mock_odoo_pool):
             mock_odoo_client.search_read.side_effect = Exception("Connection error")
 
             result = await call_tool("search_records", {"model": "res.partner"})
@@ -186,8 +265,20 @@ class TestServer:
     @pytest.mark.anyio
     async def test_unknown_tool(self, mock_env):
         """Test calling unknown tool."""
-        with patch("mcp_server_odoo.server.get_odoo_client"):
+        with patch("mcp_server_odoo.server.get_odoo_pool"):
             result = await call_tool("unknown_tool", {})
 
         assert len(result) == 1
         assert "Unknown tool: unknown_tool" in result[0].text
+
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [("ODOO_DEFAULT_FIELDS", "{not json"), ("ODOO_POOL_SIZE", "many")],
+    )
+    def test_malformed_env_reported_as_invalid_config(self, mock_env, monkeypatch, name, value):
+        """Test that unparsable environment values surface as configuration errors."""
+        monkeypatch.setattr(server, "odoo_pool", None)
+        monkeypatch.setenv(name, value)
+
+        with pytest.raises(ValueError, match="Invalid Odoo configuration"):
+            get_odoo_pool()